@@ -35,17 +35,32 @@ Important:
     Mark fields as optional with: `field_name: str | None = None`
 """
 
+from typing import TYPE_CHECKING, Any
+
 from parsefy.client import Parsefy
 from parsefy.errors import APIError, ExtractionError, ParsefyError, ValidationError
-from parsefy.types import (
-    APIErrorDetail,
-    ExtractResult,
-    ExtractionMeta,
-    ExtractionMetadata,
-    FieldConfidence,
-    Verification,
-    VerificationCheck,
-)
+
+if TYPE_CHECKING:
+    from parsefy.types import (
+        APIErrorDetail,
+        ExtractResult,
+        ExtractionMeta,
+        ExtractionMetadata,
+        FieldConfidence,
+        Verification,
+        VerificationCheck,
+    )
+
+# Response models live in parsefy.types and are imported on first access
+_TYPE_NAMES = frozenset({
+    "APIErrorDetail",
+    "ExtractResult",
+    "ExtractionMeta",
+    "ExtractionMetadata",
+    "FieldConfidence",
+    "Verification",
+    "VerificationCheck",
+})
 
 __version__ = "1.1.2"
 
@@ -63,3 +78,13 @@ __all__ = [
     "Verification",
     "VerificationCheck",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TYPE_NAMES:
+        from parsefy import types
+
+        value = getattr(types, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
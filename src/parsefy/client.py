@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import gzip
+import importlib.util
+import io
 import json
 import os
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
-from typing import Any, BinaryIO, TypeVar
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar, cast
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from parsefy.errors import APIError, ValidationError
-from parsefy.types import (
-    APIErrorDetail,
-    ExtractResult,
-    ExtractionMeta,
-    ExtractionMetadata,
-    FieldConfidence,
-    Verification,
-    VerificationCheck,
-)
+from parsefy.utils import get_file_extension
+
+if TYPE_CHECKING:
+    from parsefy.types import ExtractResult
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - only without the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - only without the "fast" extra
+    fastjsonschema = None
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -33,6 +45,126 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 BASE_URL = "https://api.parsefy.io"
 DEFAULT_CONFIDENCE_THRESHOLD = 0.85
 
+# Connection pool sizing shared by the sync and async HTTP clients
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+# Schemas larger than this are gzipped when compress_schema=True
+_COMPRESS_MIN_SIZE = 2048
+
+# httpx only supports HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it's installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the stdlib handles
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_schema(schema: type[BaseModel]) -> str:
+    """
+    Build the `output_schema` payload for a Pydantic model class.
+
+    The JSON Schema is generated, stripped of titles and serialized once per
+    schema class; subsequent extractions with the same class reuse the string.
+    """
+    json_schema = schema.model_json_schema()
+    Parsefy._strip_titles(json_schema)
+    return _dumps(json_schema)
+
+
+@functools.lru_cache(maxsize=256)
+def _result_adapter(schema: type[T]) -> TypeAdapter[ExtractResult[T]]:
+    """
+    Return a reusable validator for `ExtractResult[schema]` responses.
+
+    Cached per class, so schemas built dynamically (e.g. with create_model)
+    should be created once and reused by the caller to benefit.
+    """
+    # Imported here so `import parsefy` doesn't load the response models
+    from parsefy.types import ExtractResult
+
+    adapter = TypeAdapter(ExtractResult[schema])  # type: ignore[valid-type]
+    # ExtractResult uses defer_build, so the adapter would otherwise only
+    # build its validator on first use; build it now so prewarm() takes the
+    # cost up front. (Older pydantic versions build eagerly, without rebuild.)
+    if hasattr(adapter, "rebuild"):
+        adapter.rebuild(force=True)
+    return adapter
+
+
+@functools.lru_cache(maxsize=256)
+def _json_validator(schema: type[BaseModel]) -> Callable[[Any], Any]:
+    """Compile the output_schema of a Pydantic model class into a validator."""
+    json_schema = _loads(_compiled_schema(schema).encode())
+    return fastjsonschema.compile(json_schema)  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=256)
+def _compressed_schema(schema: type[BaseModel]) -> bytes:
+    """Gzip the compiled output_schema for a Pydantic model class."""
+    return gzip.compress(_compiled_schema(schema).encode(), compresslevel=1)
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Read-only file view over a bytes-like buffer.
+
+    httpx's multipart encoder sends `bytes` as-is but needs a file object for
+    anything else. Reading through a memoryview keeps bytearray and memoryview
+    uploads from being copied into a second full-size `bytes` object.
+    """
+
+    def __init__(self, buffer: bytearray | memoryview) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._view[self._position : self._position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._position = max(offset, 0)
+        return self._position
+
+
+@contextlib.contextmanager
+def _open_upload(content: Path | bytes | BinaryIO) -> Iterator[bytes | BinaryIO]:
+    """Open a prepared file for streaming; bytes and file objects pass through."""
+    if isinstance(content, Path):
+        with content.open("rb") as fh:
+            yield fh
+    else:
+        yield content
+
 
 class Parsefy:
     """
@@ -46,6 +178,13 @@ class Parsefy:
         api_key: Your Parsefy API key. If not provided, reads from
                  PARSEFY_API_KEY environment variable.
         timeout: Request timeout in seconds (default: 60)
+        compress_schema: Gzip large output schemas before upload (default: False).
+                 Requires server support; schemas under 2KB are always sent as-is.
+        base_url: API base URL (default: https://api.parsefy.io)
+        local_validate: Check each extracted object against the schema's JSON
+                 Schema with a compiled fastjsonschema validator before
+                 building the Pydantic model (default: False). Requires the
+                 "fast" extra.
 
     Important - Required vs Optional Fields:
         By default, ALL fields in your Pydantic model are required. If a required
@@ -69,6 +208,11 @@ class Parsefy:
         Tip: Only mark fields as required if they MUST be present. Making rarely-
         present fields required will trigger expensive fallback models frequently.
 
+    Connection Reuse:
+        Each client owns a pool of keep-alive connections. Reuse a single
+        Parsefy instance across requests; do not instantiate it inside a hot
+        loop or per web request, or every call pays for a new TCP/TLS handshake.
+
     Example:
         ```python
         from parsefy import Parsefy
@@ -93,6 +237,9 @@ class Parsefy:
         api_key: str | None = None,
         *,
         timeout: float = 60.0,
+        compress_schema: bool = False,
+        base_url: str = BASE_URL,
+        local_validate: bool = False,
     ):
         self.api_key = api_key or os.environ.get("PARSEFY_API_KEY")
         if not self.api_key:
@@ -101,85 +248,179 @@ class Parsefy:
             )
 
         self.timeout = timeout
+        self.compress_schema = compress_schema
+        if local_validate and fastjsonschema is None:
+            raise ValidationError(
+                "local_validate requires fastjsonschema. Install it with: pip install parsefy[fast]"
+            )
+        self.local_validate = local_validate
+        self.base_url = base_url.rstrip("/")
+        self._extract_url = httpx.URL(f"{self.base_url}/v1/extract")
 
         self._client = httpx.Client(
+            base_url=self.base_url,
             timeout=timeout,
             headers={"Authorization": f"Bearer {self.api_key}"},
+            # Pool settings go to the client rather than a custom transport,
+            # which would stop httpx honouring HTTP(S)_PROXY from the environment
+            limits=_DEFAULT_LIMITS,
         )
         self._async_client: httpx.AsyncClient | None = None
+        # Loop the async client's connections belong to
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._aclose_task: asyncio.Task[None] | None = None
 
     def _get_async_client(self) -> httpx.AsyncClient:
         """Lazily create async client."""
         if self._async_client is None:
+            self._async_loop = asyncio.get_running_loop()
             self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
                 timeout=self.timeout,
                 headers={"Authorization": f"Bearer {self.api_key}"},
+                # HTTP/2 multiplexes concurrent extract_async() calls over
+                # one connection instead of one connection per request
+                http2=_HTTP2_AVAILABLE,
+                limits=_DEFAULT_LIMITS,
             )
         return self._async_client
 
-    def _strip_titles(self, schema: Any) -> None:
+    @staticmethod
+    def _strip_titles(schema: Any) -> None:
         """
-        Recursively remove 'title' keys from schema to save tokens.
+        Remove 'title' keys from schema (in place) to save tokens.
 
         Pydantic adds a 'title' field to every property by default, which
-        wastes tokens and adds noise for the LLM.
+        wastes tokens and adds noise for the LLM. The schema is walked with an
+        explicit stack, so deeply nested models can't hit the recursion limit.
+
+        Only string-valued titles are removed; a property that is itself named
+        "title" maps to a dict and is kept.
         """
-        if isinstance(schema, dict):
-            if "title" in schema:
-                del schema["title"]
-            for value in schema.values():
-                self._strip_titles(value)
-        elif isinstance(schema, list):
-            for item in schema:
-                self._strip_titles(item)
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if isinstance(node.get("title"), str):
+                    del node["title"]
+                stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+            elif isinstance(node, list):
+                stack.extend(v for v in node if isinstance(v, (dict, list)))
 
     def _prepare_file(
         self,
-        file: str | Path | bytes | BinaryIO,
-    ) -> tuple[str, bytes, str]:
+        file: str | Path | bytes | bytearray | memoryview | BinaryIO,
+    ) -> tuple[str, Path | bytes | BinaryIO, str]:
         """
         Prepare file for upload.
 
+        Paths and seekable file objects are validated without reading them;
+        httpx streams their contents when the request is sent.
+
         Returns:
-            Tuple of (filename, file_bytes, content_type)
+            Tuple of (filename, content, content_type), where content is a
+            Path, bytes, or a file-like object
         """
-        if isinstance(file, (str, Path)):
-            path = Path(file)
-            if not path.exists():
-                raise ValidationError(f"File not found: {path}")
+        content: Path | bytes | BinaryIO
+        # Seekable file object that the caller has already partly read
+        partial: BinaryIO | None = None
 
-            suffix = path.suffix.lower()
-            if suffix not in MIME_TYPES:
+        if isinstance(file, (str, Path)):
+            suffix = get_file_extension(file)
+            content_type = MIME_TYPES.get(suffix)
+            if content_type is None:
                 raise ValidationError(
                     f"Unsupported file type: {suffix}. Only PDF and DOCX are supported."
                 )
 
-            content_type = MIME_TYPES[suffix]
-            file_bytes = path.read_bytes()
+            path = Path(file)
+            try:
+                # One stat() call both checks existence and gives the size,
+                # so oversized files are rejected without being opened
+                size = path.stat().st_size
+            except (FileNotFoundError, NotADirectoryError):
+                raise ValidationError(f"File not found: {path}") from None
+
+            content = path
             filename = path.name
 
-        elif isinstance(file, bytes):
-            # For bytes, we can't determine type - default to PDF
-            file_bytes = file
+        elif isinstance(file, (bytes, bytearray, memoryview)):
+            # For bytes, we can't determine type - default to PDF.
+            # httpx uploads `bytes` without copying; other buffers are wrapped
+            # in a zero-copy reader.
+            if isinstance(file, bytes):
+                content = file
+            elif isinstance(file, memoryview) and not file.c_contiguous:
+                # Strided views (e.g. mv[::2]) can't be read in place
+                content = file.tobytes()
+            else:
+                content = cast(BinaryIO, _BufferReader(file))
+            size = memoryview(file).nbytes
             filename = "document.pdf"
             content_type = "application/pdf"
 
         else:
             # File-like object
-            file_bytes = file.read()
             filename = getattr(file, "name", "document.pdf")
-            suffix = Path(filename).suffix.lower()
-            content_type = MIME_TYPES.get(suffix, "application/pdf")
-
-        if len(file_bytes) == 0:
+            content_type = MIME_TYPES.get(get_file_extension(filename), "application/pdf")
+            try:
+                # Only the part from the current position onwards is uploaded
+                position = file.tell()
+                size = file.seek(0, os.SEEK_END) - position
+                file.seek(position)
+                content = file
+                if position:
+                    partial = file
+            except (AttributeError, OSError):
+                # Not seekable, so the size is only known once it's read
+                content = file.read()
+                size = len(content)
+
+        if size == 0:
             raise ValidationError("File is empty.")
 
-        if len(file_bytes) > MAX_FILE_SIZE:
+        if size > MAX_FILE_SIZE:
             raise ValidationError(
-                f"File size ({len(file_bytes)} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)."
+                f"File size ({size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)."
+            )
+
+        if partial is not None:
+            # httpx rewinds seekable files before uploading them, so only the
+            # unread remainder is read and sent
+            content = partial.read()
+
+        return filename, content, content_type
+
+    def _build_form(
+        self,
+        schema: type[T],
+        confidence_threshold: float,
+        enable_verification: bool,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """
+        Build the non-file multipart fields for an extract request.
+
+        Returns:
+            Tuple of (data, files) to merge into the request
+        """
+        # Convert Pydantic model to JSON Schema and optimize for tokens
+        output_schema = _compiled_schema(schema)
+
+        data_payload = {"confidence_threshold": str(confidence_threshold)}
+        if enable_verification:
+            data_payload["enable_verification"] = "true"
+
+        files: dict[str, Any] = {}
+        if self.compress_schema and len(output_schema) > _COMPRESS_MIN_SIZE:
+            files["output_schema"] = (
+                "schema.json.gz",
+                _compressed_schema(schema),
+                "application/json+gzip",
             )
+        else:
+            data_payload["output_schema"] = output_schema
 
-        return filename, file_bytes, content_type
+        return data_payload, files
 
     def _parse_response(
         self,
@@ -188,10 +429,14 @@ class Parsefy:
     ) -> ExtractResult[T]:
         """Parse API response into ExtractResult."""
         if response.status_code != 200:
-            try:
-                error_detail = response.json()
-            except Exception:
-                error_detail = response.text
+            # Gateways and proxies often answer with HTML or plain text, so
+            # only attempt JSON decoding when the server says it's JSON.
+            error_detail: Any = response.text
+            if "json" in response.headers.get("content-type", ""):
+                try:
+                    error_detail = _loads(response.content)
+                except ValueError:
+                    pass
 
             raise APIError(
                 message=f"API request failed with status {response.status_code}",
@@ -199,81 +444,27 @@ class Parsefy:
                 response=error_detail,
             )
 
-        data = response.json()
-
-        metadata = ExtractionMetadata(
-            processing_time_ms=data["metadata"]["processing_time_ms"],
-            credits=data["metadata"]["credits"],
-            fallback_triggered=data["metadata"]["fallback_triggered"],
-        )
-
-        # Parse the new _meta structure
-        meta = None
-        if data.get("_meta"):
-            meta_data = data["_meta"]
-            field_confidence = [
-                FieldConfidence(
-                    field=fc["field"],
-                    score=fc["score"],
-                    reason=fc["reason"],
-                    page=fc["page"],
-                    text=fc["text"],
-                )
-                for fc in meta_data.get("field_confidence", [])
-            ]
-            meta = ExtractionMeta(
-                confidence_score=meta_data["confidence_score"],
-                field_confidence=field_confidence,
-                issues=meta_data.get("issues", []),
-            )
-
-        # Parse verification results if present
-        verification = None
-        if data.get("verification"):
-            verification_data = data["verification"]
-            checks_run = [
-                VerificationCheck(
-                    type=check["type"],
-                    status=check["status"],
-                    fields=check["fields"],
-                    passed=check["passed"],
-                    delta=check["delta"],
-                    expected=check["expected"],
-                    actual=check["actual"],
-                )
-                for check in verification_data.get("checks_run", [])
-            ]
-            verification = Verification(
-                status=verification_data["status"],
-                checks_passed=verification_data["checks_passed"],
-                checks_failed=verification_data["checks_failed"],
-                cannot_verify_count=verification_data["cannot_verify_count"],
-                checks_run=checks_run,
-            )
-
-        error = None
-        if data.get("error"):
-            error = APIErrorDetail(
-                code=data["error"]["code"],
-                message=data["error"]["message"],
-            )
-
-        extracted_data = None
-        if data.get("object") is not None:
-            extracted_data = schema.model_validate(data["object"])
-
-        return ExtractResult[T](
-            data=extracted_data,
-            meta=meta,
-            metadata=metadata,
-            verification=verification,
-            error=error,
-        )
+        if self.local_validate:
+            body = _loads(response.content)
+            extracted = body.get("object") if isinstance(body, dict) else None
+            if extracted is not None:
+                try:
+                    _json_validator(schema)(extracted)
+                except fastjsonschema.JsonSchemaException as e:
+                    raise ValidationError(
+                        f"Extracted object does not match schema: {e.message}"
+                    ) from e
+            # The body is already decoded, so validate it rather than parse again
+            return _result_adapter(schema).validate_python(body)
+
+        # Parse and validate the whole response, including the user's schema,
+        # from the raw bytes in a single pydantic-core pass.
+        return _result_adapter(schema).validate_json(response.content)
 
     def extract(
         self,
         *,
-        file: str | Path | bytes | BinaryIO,
+        file: str | Path | bytes | bytearray | memoryview | BinaryIO,
         schema: type[T],
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
         enable_verification: bool = False,
@@ -284,7 +475,7 @@ class Parsefy:
         Args:
             file: Document to extract from. Can be:
                   - str or Path: Path to the file
-                  - bytes: Raw file contents
+                  - bytes, bytearray or memoryview: Raw file contents
                   - BinaryIO: File-like object
             schema: Pydantic model class defining the extraction schema.
                     Use Field(description="...") to guide the AI.
@@ -337,31 +528,27 @@ class Parsefy:
                 print(f"Error: {result.error.message}")
             ```
         """
-        filename, file_bytes, content_type = self._prepare_file(file)
-
-        # Convert Pydantic model to JSON Schema and optimize for tokens
-        json_schema = schema.model_json_schema()
-        self._strip_titles(json_schema)
-
-        data_payload = {
-            "output_schema": json.dumps(json_schema),
-            "confidence_threshold": str(confidence_threshold),
-        }
-        if enable_verification:
-            data_payload["enable_verification"] = "true"
+        filename, content, content_type = self._prepare_file(file)
+        data_payload, files = self._build_form(
+            schema, confidence_threshold, enable_verification
+        )
 
-        response = self._client.post(
-            f"{BASE_URL}/v1/extract",
-            files={"file": (filename, file_bytes, content_type)},
+        with _open_upload(content) as upload, self._client.stream(
+            "POST",
+            self._extract_url,
+            files={"file": (filename, upload, content_type), **files},
             data=data_payload,
-        )
+        ) as response:
+            # Read the body as raw bytes only; _parse_response validates them
+            # directly, so httpx never decodes a text copy of the payload.
+            response.read()
 
         return self._parse_response(response, schema)
 
     async def extract_async(
         self,
         *,
-        file: str | Path | bytes | BinaryIO,
+        file: str | Path | bytes | bytearray | memoryview | BinaryIO,
         schema: type[T],
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
         enable_verification: bool = False,
@@ -388,32 +575,145 @@ class Parsefy:
             )
             ```
         """
-        filename, file_bytes, content_type = self._prepare_file(file)
+        filename, content, content_type = self._prepare_file(file)
+        data_payload, files = self._build_form(
+            schema, confidence_threshold, enable_verification
+        )
 
-        json_schema = schema.model_json_schema()
-        self._strip_titles(json_schema)
+        client = self._get_async_client()
+        with _open_upload(content) as upload:
+            async with client.stream(
+                "POST",
+                self._extract_url,
+                files={"file": (filename, upload, content_type), **files},
+                data=data_payload,
+            ) as response:
+                await response.aread()
 
-        data_payload = {
-            "output_schema": json.dumps(json_schema),
-            "confidence_threshold": str(confidence_threshold),
-        }
-        if enable_verification:
-            data_payload["enable_verification"] = "true"
+        return self._parse_response(response, schema)
 
-        client = self._get_async_client()
-        response = await client.post(
-            f"{BASE_URL}/v1/extract",
-            files={"file": (filename, file_bytes, content_type)},
-            data=data_payload,
+    async def extract_many(
+        self,
+        *,
+        files: Sequence[str | Path | bytes | bytearray | memoryview | BinaryIO],
+        schema: type[T],
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        enable_verification: bool = False,
+        concurrency: int = 16,
+    ) -> list[ExtractResult[T] | BaseException]:
+        """
+        Extract structured data from several documents concurrently.
+
+        Runs extract_async() for each file, with at most `concurrency`
+        requests in flight. All requests share this client's connection pool
+        (and a single HTTP/2 connection when the `http2` extra is installed).
+
+        A failure for one file doesn't discard the others: every file is
+        processed, and a file that failed has its exception (e.g.
+        ValidationError or APIError) returned in its place instead of raised.
+
+        Args:
+            files: Documents to extract from (see extract() for accepted types)
+            schema: Pydantic model class defining the extraction schema
+            confidence_threshold: Minimum confidence score (0-1). Default: 0.85
+            enable_verification: Enable math verification. Default: False
+            concurrency: Maximum number of simultaneous requests. Default: 16
+
+        Returns:
+            One entry per file, in the same order as `files`: an ExtractResult,
+            or the exception raised while extracting that file.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            ```python
+            async with Parsefy() as client:
+                results = await client.extract_many(
+                    files=["jan.pdf", "feb.pdf", "mar.pdf"],
+                    schema=Invoice,
+                )
+
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Failed: {result}")
+                else:
+                    print(result.data)
+            ```
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def extract_one(
+            file: str | Path | bytes | bytearray | memoryview | BinaryIO,
+        ) -> ExtractResult[T]:
+            async with semaphore:
+                return await self.extract_async(
+                    file=file,
+                    schema=schema,
+                    confidence_threshold=confidence_threshold,
+                    enable_verification=enable_verification,
+                )
+
+        return list(
+            await asyncio.gather(*(extract_one(f) for f in files), return_exceptions=True)
         )
 
-        return self._parse_response(response, schema)
+    def prewarm(self, schema: type[BaseModel]) -> None:
+        """
+        Build the cached request schema and response validator for `schema`.
+
+        Both are otherwise built lazily on the first extract() with that
+        schema. Call this at startup to keep that one-time cost out of the
+        first request. The caches are shared by all Parsefy instances.
+
+        Example:
+            ```python
+            client = Parsefy()
+            client.prewarm(Invoice)
+            ```
+        """
+        _compiled_schema(schema)
+        if self.compress_schema:
+            _compressed_schema(schema)
+        if self.local_validate:
+            _json_validator(schema)
+        _result_adapter(schema)
 
     def close(self) -> None:
-        """Close the HTTP client connections."""
+        """
+        Close the HTTP client connections.
+
+        Prefer `aclose()` in async code. The async client is closed on the
+        event loop that created it: directly if that loop is idle, or as a
+        scheduled task if it is running. If that loop has already been closed
+        (e.g. after `asyncio.run()` returned), its connections went with it
+        and the async client is simply dropped.
+        """
         self._client.close()
-        if self._async_client:
-            # Note: async client should be closed with await
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if client is None or client.is_closed or loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        try:
+            if running is loop:
+                # Keep a reference so the task isn't garbage collected early
+                self._aclose_task = loop.create_task(client.aclose())
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            elif running is None:
+                loop.run_until_complete(client.aclose())
+        except RuntimeError:
+            # close() must not fail; the connections are dropped instead
             pass
 
     async def aclose(self) -> None:
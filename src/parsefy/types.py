@@ -1,8 +1,8 @@
 """Type definitions for the Parsefy SDK."""
 
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -10,6 +10,8 @@ T = TypeVar("T", bound=BaseModel)
 class FieldConfidence(BaseModel):
     """Confidence information for a single extracted field."""
 
+    model_config = ConfigDict(defer_build=True)
+
     field: str = Field(description="JSON path to the field (e.g., '$.invoice_number')")
     score: float = Field(description="Confidence score between 0 and 1")
     reason: str = Field(description="Explanation for the confidence score")
@@ -25,6 +27,8 @@ class ExtractionMeta(BaseModel):
     extracted field, along with the source text used for extraction.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     confidence_score: float = Field(
         description="Overall confidence score for the extraction (0-1)"
     )
@@ -41,9 +45,9 @@ class ExtractionMeta(BaseModel):
 class ExtractionMetadata(BaseModel):
     """Metadata about the extraction process."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(defer_build=True)
 
-    processing_time_ms: int = Field(alias="processing_time_ms")
+    processing_time_ms: int
     credits: int
     fallback_triggered: bool
 
@@ -51,6 +55,8 @@ class ExtractionMetadata(BaseModel):
 class APIErrorDetail(BaseModel):
     """Error information when extraction fails."""
 
+    model_config = ConfigDict(defer_build=True)
+
     code: str
     message: str
 
@@ -58,6 +64,8 @@ class APIErrorDetail(BaseModel):
 class VerificationCheck(BaseModel):
     """Individual math verification check result."""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: str = Field(description="Type of verification check (e.g., 'HORIZONTAL_SUM', 'VERTICAL_SUM')")
     status: str = Field(description="Status of the check: 'PASSED', 'FAILED', or 'CANNOT_VERIFY'")
     fields: list[str] = Field(description="Fields involved in this verification check")
@@ -75,6 +83,8 @@ class Verification(BaseModel):
     (e.g., totals, subtotals, taxes, line item sums).
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     status: str = Field(
         description="Overall verification status: 'PASSED', 'FAILED', 'PARTIAL', 'CANNOT_VERIFY', or 'NO_RULES'"
     )
@@ -102,9 +112,13 @@ class ExtractResult(BaseModel, Generic[T]):
     `enable_verification=True` is used in the extraction request.
     """
 
-    data: T | None = None
+    model_config = ConfigDict(defer_build=True)
+
+    # The API sends these as "object" and "_meta"; both spellings are accepted
+    data: T | None = Field(default=None, validation_alias=AliasChoices("data", "object"))
     meta: ExtractionMeta | None = Field(
         default=None,
+        validation_alias=AliasChoices("meta", "_meta"),
         description="Field-level confidence scores and extraction evidence"
     )
     metadata: ExtractionMetadata
@@ -113,3 +127,9 @@ class ExtractResult(BaseModel, Generic[T]):
         description="Math verification results (only present when enable_verification=True)"
     )
     error: APIErrorDetail | None = None
+
+    @field_validator("meta", "verification", "error", mode="before")
+    @classmethod
+    def _empty_section_to_none(cls, value: Any) -> Any:
+        """Treat an empty section (e.g. `"_meta": {}`) as absent."""
+        return value or None
@@ -1,16 +1,28 @@
 """Utility functions for the Parsefy SDK."""
 
+import functools
+import os
 from pathlib import Path
 
-SUPPORTED_EXTENSIONS = {".pdf", ".docx"}
+SUPPORTED_EXTENSIONS = frozenset({".pdf", ".docx"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _ext_of(name: str) -> str:
+    """Return the lowercase extension of a file name (cached per name)."""
+    # Same rules as Path.suffix, without constructing a Path
+    dot = name.rfind(".")
+    sep = max(name.rfind("/"), name.rfind(os.sep))
+    if dot <= sep + 1 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
 
 
 def is_supported_file(path: str | Path) -> bool:
     """Check if a file path has a supported extension."""
-    return Path(path).suffix.lower() in SUPPORTED_EXTENSIONS
+    return _ext_of(os.fspath(path)) in SUPPORTED_EXTENSIONS
 
 
-def get_file_extension(filename: str) -> str:
+def get_file_extension(filename: str | Path) -> str:
     """Get the lowercase file extension from a filename."""
-    return Path(filename).suffix.lower()
-
+    return _ext_of(os.fspath(filename))
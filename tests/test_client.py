@@ -1,14 +1,26 @@
 """Tests for the Parsefy client."""
 
+import asyncio
+import gzip
+import json
 import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
+from pydantic import ValidationError as PydanticValidationError
+from pydantic_core import SchemaValidator
 
+import parsefy
 from parsefy import Parsefy, APIError, ValidationError, ExtractResult
+from parsefy.client import _compiled_schema, _dumps, _json_validator, _result_adapter
 
 
 class SampleSchema(BaseModel):
@@ -45,8 +57,6 @@ class TestParsefyInit:
     def test_init_without_api_key_raises(self) -> None:
         """Test that initialization without API key raises ValidationError."""
         with patch.dict(os.environ, {}, clear=True):
-            # Remove the env var if it exists
-            os.environ.pop("PARSEFY_API_KEY", None)
             with pytest.raises(ValidationError) as exc_info:
                 Parsefy()
             assert "API key is required" in str(exc_info.value)
@@ -57,6 +67,47 @@ class TestParsefyInit:
         assert client.timeout == 120.0
         client.close()
 
+    def test_init_with_custom_base_url(self) -> None:
+        """Test initialization with a custom API base URL."""
+        client = Parsefy(api_key="test_key", base_url="http://localhost:8000/")
+        assert client.base_url == "http://localhost:8000"
+        assert client._extract_url == "http://localhost:8000/v1/extract"
+        client.close()
+
+    async def test_init_honours_proxy_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that both HTTP clients route through HTTPS_PROXY from the environment."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+
+        client = Parsefy(api_key="test_key")
+        async_client = client._get_async_client()
+
+        for http_client in (client._client, async_client):
+            assert any(
+                pattern.matches(client._extract_url)
+                for pattern in http_client._mounts
+            )
+        await client.aclose()
+
+
+class TestLazyImports:
+    """Tests for deferred loading of the response models."""
+
+    def test_import_does_not_load_types(self) -> None:
+        """Test that `import parsefy` doesn't import the response models."""
+        code = (
+            "import sys, parsefy; "
+            "assert 'parsefy.types' not in sys.modules; "
+            "assert parsefy.ExtractResult.__module__ == 'parsefy.types'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown package attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = parsefy.NotAType
+
 
 class TestStripTitles:
     """Tests for title stripping optimization."""
@@ -127,6 +178,143 @@ class TestStripTitles:
         assert "title" not in schema["properties"]["items"]
         assert "title" not in schema["properties"]["items"]["items"]
 
+    def test_strip_titles_keeps_property_named_title(self, client: Parsefy) -> None:
+        """Test that a field called 'title' isn't mistaken for a schema title."""
+        schema = {
+            "title": "Book",
+            "type": "object",
+            "properties": {
+                "title": {"title": "Title", "type": "string"},
+                "pages": {"title": "Pages", "type": "integer"},
+            },
+            "required": ["title", "pages"],
+        }
+
+        client._strip_titles(schema)
+
+        assert "title" not in schema
+        assert schema["properties"]["title"] == {"type": "string"}
+        assert schema["properties"]["pages"] == {"type": "integer"}
+
+    def test_strip_titles_handles_deep_nesting(self, client: Parsefy) -> None:
+        """Test that _strip_titles doesn't recurse on deeply nested schemas."""
+        schema: dict = {"title": "Leaf", "type": "string"}
+        leaf = schema
+        for _ in range(5000):
+            schema = {"title": "Node", "type": "array", "items": [schema]}
+
+        client._strip_titles(schema)
+
+        assert "title" not in schema
+        assert "title" not in leaf
+
+
+class TestCompiledSchema:
+    """Tests for the per-schema output_schema cache."""
+
+    def test_compiled_schema_strips_titles(self) -> None:
+        """Test that the compiled schema is compact JSON without titles."""
+        output_schema = _compiled_schema(SampleSchema)
+
+        assert json.loads(output_schema) == {
+            "description": "Sample schema for testing.",
+            "type": "object",
+            "properties": {
+                "name": {"description": "A name field", "type": "string"},
+                "value": {"description": "A numeric value", "type": "integer"},
+            },
+            "required": ["name", "value"],
+        }
+        assert ", " not in output_schema
+        assert '": ' not in output_schema
+
+    def test_compiled_schema_is_cached(self) -> None:
+        """Test that the schema is only generated once per class."""
+        assert _compiled_schema(SampleSchemaWithOptional) is _compiled_schema(
+            SampleSchemaWithOptional
+        )
+
+    def test_dumps_without_orjson(self) -> None:
+        """Test that the stdlib fallback emits the same compact JSON."""
+        obj = {"description": "Montant dû", "items": [1, 2.5, None, True]}
+
+        with patch("parsefy.client.orjson", None):
+            assert _dumps(obj) == '{"description":"Montant dû","items":[1,2.5,null,true]}'
+
+    def test_compiled_schema_with_wide_integer(self) -> None:
+        """Test that integers beyond 64 bits serialize, with or without orjson."""
+        BigSchema = create_model(
+            "BigSchema", amount=(int, Field(default=10**20, le=10**30))
+        )
+
+        compiled = json.loads(_compiled_schema(BigSchema))
+
+        assert compiled["properties"]["amount"]["default"] == 10**20
+        assert compiled["properties"]["amount"]["maximum"] == 10**30
+
+
+class TestPrewarm:
+    """Tests for schema cache prewarming."""
+
+    def test_prewarm_builds_caches(self) -> None:
+        """Test that prewarm() fills the schema and validator caches."""
+
+        class PrewarmSchema(BaseModel):
+            name: str
+
+        with Parsefy(api_key="test_key") as client:
+            client.prewarm(PrewarmSchema)
+
+        compiled_hits = _compiled_schema.cache_info().hits
+        adapter_hits = _result_adapter.cache_info().hits
+        _compiled_schema(PrewarmSchema)
+        adapter = _result_adapter(PrewarmSchema)
+        assert _compiled_schema.cache_info().hits == compiled_hits + 1
+        assert _result_adapter.cache_info().hits == adapter_hits + 1
+        # The validator itself is built, not deferred until the first response
+        assert isinstance(adapter.validator, SchemaValidator)
+
+
+class TestBuildForm:
+    """Tests for the extract request form fields."""
+
+    def test_build_form_sends_schema_as_text(self) -> None:
+        """Test that the schema is sent as a plain form field by default."""
+        with Parsefy(api_key="test_key") as client:
+            data, files = client._build_form(SampleSchema, 0.9, True)
+
+        assert data == {
+            "output_schema": _compiled_schema(SampleSchema),
+            "confidence_threshold": "0.9",
+            "enable_verification": "true",
+        }
+        assert files == {}
+
+    def test_build_form_compresses_large_schema(self) -> None:
+        """Test that large schemas are gzipped when compress_schema is enabled."""
+        fields = {
+            f"field_{i}": (str, Field(description=f"Description of field {i}"))
+            for i in range(50)
+        }
+        LargeSchema = create_model("LargeSchema", **fields)
+
+        with Parsefy(api_key="test_key", compress_schema=True) as client:
+            data, files = client._build_form(LargeSchema, 0.85, False)
+
+        assert "output_schema" not in data
+        filename, payload, content_type = files["output_schema"]
+        assert filename == "schema.json.gz"
+        assert content_type == "application/json+gzip"
+        assert gzip.decompress(payload).decode() == _compiled_schema(LargeSchema)
+
+    def test_build_form_skips_compressing_small_schema(self) -> None:
+        """Test that small schemas are sent uncompressed even when enabled."""
+        with Parsefy(api_key="test_key", compress_schema=True) as client:
+            data, files = client._build_form(SampleSchema, 0.85, False)
+
+        assert data["output_schema"] == _compiled_schema(SampleSchema)
+        assert files == {}
+
 
 class TestPrepareFile:
     """Tests for file preparation logic."""
@@ -146,7 +334,7 @@ class TestPrepareFile:
         filename, content, mime_type = client._prepare_file(str(pdf_file))
 
         assert filename == "test.pdf"
-        assert content == b"%PDF-1.4 test content"
+        assert content == pdf_file
         assert mime_type == "application/pdf"
 
     def test_prepare_file_from_path_object(self, client: Parsefy, tmp_path: Path) -> None:
@@ -157,7 +345,7 @@ class TestPrepareFile:
         filename, content, mime_type = client._prepare_file(docx_file)
 
         assert filename == "test.docx"
-        assert content == b"docx content"
+        assert content == docx_file
         assert (
             mime_type
             == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
@@ -171,6 +359,25 @@ class TestPrepareFile:
         assert content == b"raw bytes content"
         assert mime_type == "application/pdf"
 
+    def test_prepare_file_from_bytearray(self, client: Parsefy) -> None:
+        """Test that bytes-like buffers are wrapped instead of copied."""
+        buffer = bytearray(b"raw bytes content")
+
+        filename, content, mime_type = client._prepare_file(buffer)
+
+        assert filename == "document.pdf"
+        assert content.read() == b"raw bytes content"
+        assert mime_type == "application/pdf"
+
+    def test_prepare_file_from_strided_memoryview(self, client: Parsefy) -> None:
+        """Test that a non-contiguous memoryview is accepted."""
+        view = memoryview(b"rxaxwx xbxyxtxexsx")[::2]
+
+        filename, content, mime_type = client._prepare_file(view)
+
+        assert content == b"raw bytes"
+        assert mime_type == "application/pdf"
+
     def test_prepare_file_from_file_object(self, client: Parsefy) -> None:
         """Test preparing file from file-like object."""
         file_obj = BytesIO(b"file object content")
@@ -179,7 +386,37 @@ class TestPrepareFile:
         filename, content, mime_type = client._prepare_file(file_obj)
 
         assert filename == "uploaded.pdf"
-        assert content == b"file object content"
+        assert content is file_obj
+        assert file_obj.tell() == 0
+        assert mime_type == "application/pdf"
+
+    def test_prepare_file_from_partly_read_file_object(self, client: Parsefy) -> None:
+        """Test that only the unread part of a file object is uploaded."""
+        file_obj = BytesIO(b"HEADERJUNK%PDF-1.4 content")
+        file_obj.seek(10)
+
+        filename, content, mime_type = client._prepare_file(file_obj)
+
+        assert content == b"%PDF-1.4 content"
+
+    def test_prepare_file_from_exhausted_file_object(self, client: Parsefy) -> None:
+        """Test that a file object read to the end counts as empty."""
+        file_obj = BytesIO(b"already consumed")
+        file_obj.read()
+
+        with pytest.raises(ValidationError) as exc_info:
+            client._prepare_file(file_obj)
+        assert "File is empty" in str(exc_info.value)
+
+    def test_prepare_file_from_unseekable_file_object(self, client: Parsefy) -> None:
+        """Test that non-seekable file objects are read to determine their size."""
+        file_obj = MagicMock(spec=["read"])
+        file_obj.read.return_value = b"streamed content"
+
+        filename, content, mime_type = client._prepare_file(file_obj)
+
+        assert filename == "document.pdf"
+        assert content == b"streamed content"
         assert mime_type == "application/pdf"
 
     def test_prepare_file_not_found(self, client: Parsefy) -> None:
@@ -216,6 +453,19 @@ class TestPrepareFile:
             client._prepare_file(large_file)
         assert "exceeds maximum allowed size" in str(exc_info.value)
 
+    def test_prepare_file_too_large_is_not_read(
+        self, client: Parsefy, tmp_path: Path
+    ) -> None:
+        """Test that oversized files are rejected from their size alone."""
+        large_file = tmp_path / "large.pdf"
+        with large_file.open("wb") as fh:
+            fh.truncate(11 * 1024 * 1024)
+
+        with patch.object(Path, "open", side_effect=AssertionError("file was opened")):
+            with pytest.raises(ValidationError) as exc_info:
+                client._prepare_file(large_file)
+        assert "exceeds maximum allowed size" in str(exc_info.value)
+
 
 class TestParseResponse:
     """Tests for response parsing logic."""
@@ -227,11 +477,32 @@ class TestParseResponse:
         yield client
         client.close()
 
+    @pytest.mark.parametrize("section", ["_meta", "verification", "error"])
+    def test_parse_response_treats_empty_section_as_absent(
+        self, client: Parsefy, section: str
+    ) -> None:
+        """Test that an empty envelope section is parsed as None."""
+        payload = {
+            "object": {"name": "Test", "value": 42},
+            "metadata": {
+                "processing_time_ms": 1500,
+                "credits": 1,
+                "fallback_triggered": False,
+            },
+            section: {},
+        }
+        mock_response = httpx.Response(200, json=payload)
+
+        result = client._parse_response(mock_response, SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert result.meta is None
+        assert result.verification is None
+        assert result.error is None
+
     def test_parse_successful_response(self, client: Parsefy) -> None:
         """Test parsing a successful API response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        payload = {
             "object": {"name": "Test", "value": 42},
             "_meta": {
                 "confidence_score": 0.95,
@@ -260,6 +531,7 @@ class TestParseResponse:
             },
             "error": None,
         }
+        mock_response = httpx.Response(200, json=payload)
 
         result = client._parse_response(mock_response, SampleSchema)
 
@@ -278,9 +550,7 @@ class TestParseResponse:
 
     def test_parse_response_without_meta(self, client: Parsefy) -> None:
         """Test parsing a response without _meta field (backward compatibility)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        payload = {
             "object": {"name": "Test", "value": 42},
             "metadata": {
                 "processing_time_ms": 1500,
@@ -289,6 +559,7 @@ class TestParseResponse:
             },
             "error": None,
         }
+        mock_response = httpx.Response(200, json=payload)
 
         result = client._parse_response(mock_response, SampleSchema)
 
@@ -298,9 +569,7 @@ class TestParseResponse:
 
     def test_parse_extraction_error_response(self, client: Parsefy) -> None:
         """Test parsing a response with extraction error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        payload = {
             "object": None,
             "_meta": {
                 "confidence_score": 0.3,
@@ -317,6 +586,7 @@ class TestParseResponse:
                 "message": "Could not extract data from document",
             },
         }
+        mock_response = httpx.Response(200, json=payload)
 
         result = client._parse_response(mock_response, SampleSchema)
 
@@ -330,15 +600,302 @@ class TestParseResponse:
 
     def test_parse_http_error_response(self, client: Parsefy) -> None:
         """Test that HTTP errors raise APIError."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Unauthorized"}
+        payload = {"error": "Unauthorized"}
+        mock_response = httpx.Response(401, json=payload)
 
         with pytest.raises(APIError) as exc_info:
             client._parse_response(mock_response, SampleSchema)
 
         assert exc_info.value.status_code == 401
         assert "401" in exc_info.value.message
+        assert exc_info.value.response == {"error": "Unauthorized"}
+
+    def test_parse_http_error_non_json_response(self, client: Parsefy) -> None:
+        """Test that non-JSON error bodies are returned as text."""
+        mock_response = httpx.Response(
+            502,
+            text="<html>Bad Gateway</html>",
+            headers={"content-type": "text/html"},
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client._parse_response(mock_response, SampleSchema)
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.response == "<html>Bad Gateway</html>"
+
+    def test_parse_http_error_malformed_json_response(self, client: Parsefy) -> None:
+        """Test that malformed JSON error bodies fall back to text."""
+        mock_response = httpx.Response(
+            500,
+            text="{not json",
+            headers={"content-type": "application/json"},
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client._parse_response(mock_response, SampleSchema)
+
+        assert exc_info.value.response == "{not json"
+
+    def test_parse_http_error_response_without_orjson(self, client: Parsefy) -> None:
+        """Test that error bodies are decoded by the stdlib fallback."""
+        mock_response = httpx.Response(429, json={"error": "Too many requests"})
+
+        with patch("parsefy.client.orjson", None):
+            with pytest.raises(APIError) as exc_info:
+                client._parse_response(mock_response, SampleSchema)
+
+        assert exc_info.value.response == {"error": "Too many requests"}
+
+    def test_result_adapter_is_cached(self) -> None:
+        """Test that the response validator is built once per schema class."""
+        assert _result_adapter(SampleSchema) is _result_adapter(SampleSchema)
+
+    def test_parse_response_validates_user_schema(self, client: Parsefy) -> None:
+        """Test that the extracted object is still validated against the schema."""
+        payload = {
+            "object": {"name": "Test", "value": "not a number"},
+            "metadata": {
+                "processing_time_ms": 1500,
+                "credits": 1,
+                "fallback_triggered": False,
+            },
+            "error": None,
+        }
+        mock_response = httpx.Response(200, json=payload)
+
+        with pytest.raises(PydanticValidationError):
+            client._parse_response(mock_response, SampleSchema)
+
+
+class TestExtract:
+    """Tests for the extract request path."""
+
+    payload = {
+        "object": {"name": "Test", "value": 42},
+        "metadata": {
+            "processing_time_ms": 1500,
+            "credits": 1,
+            "fallback_triggered": False,
+        },
+        "error": None,
+    }
+
+    @pytest.fixture
+    def requests(self) -> list[httpx.Request]:
+        """Collect the requests sent through the mock transport."""
+        return []
+
+    @pytest.fixture
+    def client(self, requests: list[httpx.Request]) -> Parsefy:
+        """Create a test client backed by a mock transport."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            request.read()
+            requests.append(request)
+            return httpx.Response(200, json=self.payload)
+
+        client = Parsefy(api_key="test_key")
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        yield client
+        client.close()
+
+    def test_extract_uploads_file_from_path(
+        self, client: Parsefy, requests: list[httpx.Request], tmp_path: Path
+    ) -> None:
+        """Test that a file on disk is uploaded with the compiled schema."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4 test content")
+
+        result = client.extract(file=pdf_file, schema=SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert len(requests) == 1
+        assert requests[0].url == "https://api.parsefy.io/v1/extract"
+        body = requests[0].content
+        assert b'filename="test.pdf"' in body
+        assert b"%PDF-1.4 test content" in body
+        assert _compiled_schema(SampleSchema).encode() in body
+
+    async def test_extract_async_uploads_file_object(
+        self, client: Parsefy, requests: list[httpx.Request]
+    ) -> None:
+        """Test that a file object is uploaded by the async client."""
+        file_obj = BytesIO(b"file object content")
+        file_obj.name = "uploaded.pdf"
+
+        result = await client.extract_async(file=file_obj, schema=SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert len(requests) == 1
+        assert b"file object content" in requests[0].content
+
+    def test_extract_skips_already_read_part_of_file_object(
+        self, client: Parsefy, requests: list[httpx.Request]
+    ) -> None:
+        """Test that bytes before the file object's position aren't uploaded."""
+        file_obj = BytesIO(b"HEADERJUNK%PDF-1.4 content")
+        file_obj.seek(10)
+
+        client.extract(file=file_obj, schema=SampleSchema)
+
+        assert b"%PDF-1.4 content" in requests[0].content
+        assert b"HEADERJUNK" not in requests[0].content
+
+    def test_extract_uploads_memoryview(
+        self, client: Parsefy, requests: list[httpx.Request]
+    ) -> None:
+        """Test that a memoryview is streamed as the file part."""
+        content = b"%PDF-1.4 " + b"x" * (200 * 1024)
+
+        client.extract(file=memoryview(content), schema=SampleSchema)
+
+        assert len(requests) == 1
+        assert content in requests[0].content
+
+    async def test_extract_many_returns_results_in_order(
+        self, client: Parsefy, requests: list[httpx.Request]
+    ) -> None:
+        """Test that every file is uploaded and results keep the input order."""
+        files = [b"%PDF-1.4 first", b"%PDF-1.4 second", b"%PDF-1.4 third"]
+
+        results = await client.extract_many(
+            files=files, schema=SampleSchema, concurrency=2
+        )
+
+        assert [r.data for r in results] == [SampleSchema(name="Test", value=42)] * 3
+        assert len(requests) == 3
+        bodies = [r.content for r in requests]
+        for content in files:
+            assert sum(content in body for body in bodies) == 1
+
+    async def test_extract_many_limits_concurrency(self) -> None:
+        """Test that no more than `concurrency` requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=self.payload)
+
+        async with Parsefy(api_key="test_key") as client:
+            client._async_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            results = await client.extract_many(
+                files=[b"%PDF-1.4"] * 6, schema=SampleSchema, concurrency=2
+            )
+
+        assert len(results) == 6
+        assert peak == 2
+
+    async def test_extract_many_returns_exceptions_per_file(
+        self, client: Parsefy, requests: list[httpx.Request]
+    ) -> None:
+        """Test that one failing file doesn't discard the other results."""
+        results = await client.extract_many(
+            files=[b"%PDF-1.4 first", b"", b"%PDF-1.4 third"], schema=SampleSchema
+        )
+
+        assert results[0].data == SampleSchema(name="Test", value=42)
+        assert isinstance(results[1], ValidationError)
+        assert results[2].data == SampleSchema(name="Test", value=42)
+        assert len(requests) == 2
+
+    async def test_extract_many_rejects_invalid_concurrency(
+        self, client: Parsefy
+    ) -> None:
+        """Test that concurrency below 1 is rejected."""
+        with pytest.raises(ValueError, match="concurrency"):
+            await client.extract_many(
+                files=[b"%PDF-1.4"], schema=SampleSchema, concurrency=0
+            )
+
+
+class TestLocalValidation:
+    """Tests for opt-in local JSON Schema validation."""
+
+    payload = {
+        "object": {"name": "Test", "value": 42},
+        "metadata": {
+            "processing_time_ms": 1500,
+            "credits": 1,
+            "fallback_triggered": False,
+        },
+        "error": None,
+    }
+
+    @pytest.fixture
+    def client(self) -> Parsefy:
+        """Create a test client with local validation enabled."""
+        client = Parsefy(api_key="test_key", local_validate=True)
+        yield client
+        client.close()
+
+    def test_local_validate_accepts_matching_object(self, client: Parsefy) -> None:
+        """Test that objects matching the schema pass through."""
+        mock_response = httpx.Response(200, json=self.payload)
+
+        result = client._parse_response(mock_response, SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+
+    def test_local_validate_parses_body_once(self, client: Parsefy) -> None:
+        """Test that the decoded body is reused instead of parsing the JSON again."""
+        payload = {
+            **self.payload,
+            "_meta": {"confidence_score": 0.95, "field_confidence": [], "issues": []},
+        }
+        mock_response = httpx.Response(200, json=payload)
+        adapter = _result_adapter(SampleSchema)
+
+        with patch.object(
+            adapter, "validate_json", side_effect=AssertionError("parsed twice")
+        ):
+            result = client._parse_response(mock_response, SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert result.meta.confidence_score == 0.95
+
+    def test_local_validate_rejects_mismatched_object(self, client: Parsefy) -> None:
+        """Test that objects violating the JSON Schema raise ValidationError."""
+        payload = {**self.payload, "object": {"name": "Test"}}
+        mock_response = httpx.Response(200, json=payload)
+
+        with pytest.raises(ValidationError) as exc_info:
+            client._parse_response(mock_response, SampleSchema)
+        assert "does not match schema" in str(exc_info.value)
+
+    def test_local_validate_non_object_body(self, client: Parsefy) -> None:
+        """Test that a non-object JSON body fails validation, not with AttributeError."""
+        mock_response = httpx.Response(200, json=[1, 2, 3])
+
+        with pytest.raises(PydanticValidationError):
+            client._parse_response(mock_response, SampleSchema)
+
+    def test_prewarm_compiles_json_validator(self, client: Parsefy) -> None:
+        """Test that prewarm() also compiles the local JSON Schema validator."""
+
+        class LocalSchema(BaseModel):
+            name: str
+
+        client.prewarm(LocalSchema)
+
+        hits = _json_validator.cache_info().hits
+        _json_validator(LocalSchema)
+        assert _json_validator.cache_info().hits == hits + 1
+
+    def test_local_validate_requires_fastjsonschema(self) -> None:
+        """Test that enabling local validation without fastjsonschema fails early."""
+        with patch("parsefy.client.fastjsonschema", None):
+            with pytest.raises(ValidationError) as exc_info:
+                Parsefy(api_key="test_key", local_validate=True)
+        assert "fastjsonschema" in str(exc_info.value)
 
 
 class TestSchemaGeneration:
@@ -365,6 +922,40 @@ class TestSchemaGeneration:
 class TestContextManager:
     """Tests for context manager functionality."""
 
+    @pytest.fixture
+    def api_server(self) -> str:
+        """Serve a successful extraction response over a real local socket."""
+        body = json.dumps({
+            "object": {"name": "Test", "value": 42},
+            "metadata": {
+                "processing_time_ms": 1500,
+                "credits": 1,
+                "fallback_triggered": False,
+            },
+            "error": None,
+        }).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
     def test_sync_context_manager(self) -> None:
         """Test synchronous context manager."""
         with Parsefy(api_key="test_key") as client:
@@ -376,6 +967,52 @@ class TestContextManager:
         async with Parsefy(api_key="test_key") as client:
             assert client.api_key == "test_key"
 
+    def test_close_closes_async_client(self) -> None:
+        """Test that sync close() closes the async client on its idle loop."""
+        client = Parsefy(api_key="test_key")
+        loop = asyncio.new_event_loop()
+
+        async def open_client() -> httpx.AsyncClient:
+            return client._get_async_client()
+
+        try:
+            async_client = loop.run_until_complete(open_client())
+            client.close()
+        finally:
+            loop.close()
+
+        assert async_client.is_closed
+
+    def test_close_after_asyncio_run(self, api_server: str) -> None:
+        """Test that close() doesn't fail once asyncio.run() has closed the loop."""
+        client = Parsefy(api_key="test_key", base_url=api_server)
+
+        result = asyncio.run(
+            client.extract_async(file=b"%PDF-1.4 content", schema=SampleSchema)
+        )
+        client.close()
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert client._async_client is None
+
+    def test_context_manager_exit_after_asyncio_run(self, api_server: str) -> None:
+        """Test that leaving a sync `with` block after asyncio.run() doesn't fail."""
+        with Parsefy(api_key="test_key", base_url=api_server) as client:
+            asyncio.run(
+                client.extract_async(file=b"%PDF-1.4 content", schema=SampleSchema)
+            )
+
+    @pytest.mark.asyncio
+    async def test_close_inside_event_loop(self) -> None:
+        """Test that close() schedules the async client shutdown on the running loop."""
+        client = Parsefy(api_key="test_key")
+        async_client = client._get_async_client()
+
+        client.close()
+        await client._aclose_task
+
+        assert async_client.is_closed
+
 
 class TestVerification:
     """Tests for math verification functionality."""
@@ -389,9 +1026,7 @@ class TestVerification:
 
     def test_parse_response_with_verification(self, client: Parsefy) -> None:
         """Test parsing a response with verification results."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        payload = {
             "object": {"name": "Test", "value": 42},
             "_meta": {
                 "confidence_score": 0.95,
@@ -422,6 +1057,7 @@ class TestVerification:
             },
             "error": None,
         }
+        mock_response = httpx.Response(200, json=payload)
 
         result = client._parse_response(mock_response, SampleSchema)
 
@@ -436,9 +1072,7 @@ class TestVerification:
 
     def test_parse_response_without_verification(self, client: Parsefy) -> None:
         """Test parsing a response without verification (default behavior)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        payload = {
             "object": {"name": "Test", "value": 42},
             "_meta": {
                 "confidence_score": 0.95,
@@ -452,7 +1086,46 @@ class TestVerification:
             },
             "error": None,
         }
+        mock_response = httpx.Response(200, json=payload)
 
         result = client._parse_response(mock_response, SampleSchema)
 
         assert result.verification is None
+
+    def test_parse_response_accepts_unknown_verification_status(
+        self, client: Parsefy
+    ) -> None:
+        """Test that a status added by the API later doesn't fail the response."""
+        payload = {
+            "object": {"name": "Test", "value": 42},
+            "metadata": {
+                "processing_time_ms": 1500,
+                "credits": 1,
+                "fallback_triggered": False,
+            },
+            "verification": {
+                "status": "SKIPPED",
+                "checks_passed": 0,
+                "checks_failed": 0,
+                "cannot_verify_count": 0,
+                "checks_run": [
+                    {
+                        "type": "HORIZONTAL_SUM",
+                        "status": "SKIPPED",
+                        "fields": ["total"],
+                        "passed": False,
+                        "delta": 0.0,
+                        "expected": 0.0,
+                        "actual": 0.0,
+                    }
+                ],
+            },
+            "error": None,
+        }
+        mock_response = httpx.Response(200, json=payload)
+
+        result = client._parse_response(mock_response, SampleSchema)
+
+        assert result.data == SampleSchema(name="Test", value=42)
+        assert result.verification.status == "SKIPPED"
+        assert result.verification.checks_run[0].status == "SKIPPED"
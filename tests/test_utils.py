@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from parsefy.utils import get_file_extension, is_supported_file
+from parsefy.utils import _ext_of, get_file_extension, is_supported_file
 
 
 class TestIsSupportedFile:
@@ -54,3 +54,22 @@ class TestGetFileExtension:
         """Test file with multiple dots."""
         assert get_file_extension("document.backup.pdf") == ".pdf"
 
+    def test_path_object(self) -> None:
+        """Test that Path objects are accepted."""
+        assert get_file_extension(Path("/path/to/document.PDF")) == ".pdf"
+
+    def test_matches_path_suffix(self) -> None:
+        """Test that edge cases follow Path.suffix semantics."""
+        for name in [".pdf", "dir.d/file", "./doc.pdf", "a..pdf", ""]:
+            assert get_file_extension(name) == Path(name).suffix.lower()
+
+    def test_repeated_lookups_are_cached(self) -> None:
+        """Test that repeated file names hit the extension cache."""
+        _ext_of.cache_clear()
+
+        get_file_extension("cached.pdf")
+        is_supported_file("cached.pdf")
+
+        info = _ext_of.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1